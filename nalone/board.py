@@ -1,6 +1,8 @@
 """Board module."""
 import abc
-from typing import Optional, Tuple, Union
+import copy
+import operator
+from typing import Iterable, List, Optional, Tuple, Type, TypeVar, Union
 from enum import Enum
 
 
@@ -138,6 +140,9 @@ class RescuePosition(Position):
         return hash((self.value, self.next, self.type))
 
 
+TrackT = TypeVar('TrackT', bound='Track')
+
+
 class Track(metaclass=abc.ABCMeta):
     """The track of a team on the game board."""
 
@@ -145,6 +150,7 @@ class Track(metaclass=abc.ABCMeta):
         self.number_of_players = None
         self.board_type = None
         self.head = None
+        self.tail = None
 
     def __hash__(self):
         return hash((self.number_of_players, self.board_type, self.head))
@@ -160,10 +166,10 @@ class Track(metaclass=abc.ABCMeta):
 
     @classmethod
     def construct(
-            cls,
+            cls: Type[TrackT],
             number_of_players: int,
             board_type: 'BoardType'
-    ) -> 'Track':
+    ) -> TrackT:
         """Construct track.
 
         Parameters
@@ -219,11 +225,65 @@ class Track(metaclass=abc.ABCMeta):
         if self.head is None:
             self.head = position
         else:
-            pointer = self.head
-            while pointer.next is not None:
-                pointer = pointer.next
-            position.previous = pointer
-            pointer.next = position
+            position.previous = self.tail
+            self.tail.next = position
+        self.tail = position
+
+    @staticmethod
+    def move(position: Position, steps: int) -> Position:
+        """Move from a position along the track.
+
+        Parameters
+        ----------
+        position
+            The starting position.
+        steps
+            The number of positions to move, forward when positive and
+            backward when negative.  The move stops at the ends of the track.
+
+        Returns
+        -------
+        Position
+            The reached position.
+        """
+        if steps >= 0:
+            while steps and position.next is not None:
+                position = position.next
+                steps -= 1
+        else:
+            while steps and position.previous is not None:
+                position = position.previous
+                steps += 1
+        return position
+
+    def copy(self: TrackT) -> TrackT:
+        """Copy the track with new positions.
+
+        The positions are copied as they are, without being validated again.
+
+        Returns
+        -------
+        Track
+            The copied track.
+        """
+        track = self.__class__()
+        track.number_of_players = self.number_of_players
+        track.board_type = self.board_type
+        previous = None
+        pointer = self.head
+        while pointer is not None:
+            position = pointer.__class__.__new__(pointer.__class__)
+            position.__dict__ = {
+                **pointer.__dict__, 'previous': previous, 'next': None
+            }
+            if previous is None:
+                track.head = position
+            else:
+                previous.next = position
+            previous = position
+            pointer = pointer.next
+        track.tail = previous
+        return track
 
     def get_position(self, id_: int) -> Position:
         """Get a position given its identifier."""
@@ -320,6 +380,54 @@ class Board:
             self.number_of_players, self.type
         )
 
+    @classmethod
+    def many(
+            cls,
+            specs: Iterable[Tuple[int, Union[BoardType, int]]]
+    ) -> List['Board']:
+        """Construct many boards at once.
+
+        A board is constructed once for every distinct
+        ``(number_of_players, type_)`` pair, the other boards copy its tracks
+        without validating their positions again.
+
+        Parameters
+        ----------
+        specs
+            An iterable of ``(number_of_players, type_)`` pairs, such as
+            tuples, lists or the rows of an integer array.
+
+        Returns
+        -------
+        List[Board]
+            The constructed boards, in the order of ``specs``.
+        """
+        # pylint: disable=protected-access
+        specs = [
+            (operator.index(number_of_players), BoardType(type_))
+            for number_of_players, type_ in specs
+        ]
+        templates = {spec: cls(*spec) for spec in set(specs)}
+
+        boards = []
+        for spec in specs:
+            template = templates[spec]
+            board = copy.copy(template)
+            board._rescue_track = template._rescue_track.copy()
+            board._assimilation_track = template._assimilation_track.copy()
+            boards.append(board)
+        return boards
+
+    @property
+    def rescue_track(self) -> RescueTrack:
+        """Get the rescue track."""
+        return self._rescue_track
+
+    @property
+    def assimilation_track(self) -> AssimilationTrack:
+        """Get the assimilation track."""
+        return self._assimilation_track
+
     @property
     def rescue_track_length(self):
         """Get the length of the rescure track."""
@@ -0,0 +1,285 @@
+"""Decision cache module."""
+import hashlib
+import sqlite3
+import time
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from nalone.board import Board
+from nalone.map import ArtemiaMap
+
+# Index permutations mapping the 2 x 5 map grid onto itself: identity,
+# horizontal mirror, vertical mirror and half turn.  They preserve the map
+# adjacency, hence the neighbors of every place card.
+_MAP_SYMMETRIES = (
+    tuple(range(10)),
+    (4, 3, 2, 1, 0, 9, 8, 7, 6, 5),
+    (5, 6, 7, 8, 9, 0, 1, 2, 3, 4),
+    (9, 8, 7, 6, 5, 4, 3, 2, 1, 0),
+)
+
+
+def canonical_map_layout(map_: ArtemiaMap) -> Tuple[int, ...]:
+    """Get the canonical layout of a map.
+
+    Layouts that only differ by a symmetry of the map grid have the same
+    neighbors for every place card and share one canonical layout.
+
+    Parameters
+    ----------
+    map_
+        The Artemia map.
+
+    Returns
+    -------
+    Tuple[int, ...]
+        The smallest place card permutation among the symmetric layouts.
+    """
+    permutation = map_.permutation
+    return min(
+        tuple(permutation[i] for i in symmetry)
+        for symmetry in _MAP_SYMMETRIES
+    )
+
+
+def state_digest(
+        board: Board,
+        map_: ArtemiaMap,
+        hands: Iterable[Iterable[int]],
+        player: int
+) -> str:
+    """Compute the canonical digest of a game state.
+
+    Parameters
+    ----------
+    board
+        The game board.
+    map_
+        The Artemia map.
+    hands
+        The place card numbers in the hand of each player, in turn order.
+    player
+        The seat of the player choosing the action.
+
+    Returns
+    -------
+    str
+        The hexadecimal digest of the state.
+    """
+    key = (
+        board.number_of_players,
+        board.type.value,
+        canonical_map_layout(map_),
+        tuple(tuple(sorted(hand)) for hand in hands),
+        player,
+    )
+    return hashlib.sha256(repr(key).encode()).hexdigest()
+
+
+class DecisionCache:
+    """A persistent cache of agent decisions backed by SQLite.
+
+    The database runs in write-ahead logging mode so that several processes
+    can read it while another one writes.  Reads never take the write lock:
+    the access times used for the least recently used eviction are kept in
+    memory and written along with the next :meth:`put`, or in a batch once
+    ``touch_batch`` of them are pending and the database is not locked.
+
+    The number of entries is kept in the database by triggers, so the size
+    limit holds across every process writing to the same file.
+
+    Actions must be expressed with place card numbers, which are invariant
+    under the map symmetries used by :func:`canonical_map_layout`.
+
+    Parameters
+    ----------
+    path
+        The path of the database file.
+    max_entries
+        The maximum number of entries kept.  Once exceeded, the least
+        recently used entries are evicted down to 90% of it.
+    ttl
+        An optional time to live of the entries in seconds.
+    timeout
+        The number of seconds to wait for a lock held by another process.
+    touch_batch
+        The number of pending access times written in one batch by readers.
+    clock
+        The function giving the current time in seconds.
+    """
+
+    def __init__(
+            self,
+            path: str,
+            max_entries: int = 100_000,
+            ttl: Optional[float] = None,
+            timeout: float = 30.0,
+            touch_batch: int = 1000,
+            *,
+            clock: Callable[[], float] = time.time
+    ):
+        if max_entries < 1:
+            raise ValueError(
+                f'max_entries must be positive. {max_entries} was given.'
+            )
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.timeout = timeout
+        self.touch_batch = touch_batch
+        self.clock = clock
+        self._touched: Dict[str, float] = {}
+        self._connection = sqlite3.connect(path, timeout=timeout)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        if not self._connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'decisions_count'"
+        ).fetchone():
+            self._create_schema()
+
+    def _create_schema(self):
+        """Create the tables, indexes and counting triggers."""
+        with self._connection:
+            self._connection.execute('BEGIN IMMEDIATE')
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS decisions ('
+                'digest TEXT PRIMARY KEY, action TEXT NOT NULL, '
+                'value REAL NOT NULL, created REAL NOT NULL, '
+                'accessed REAL NOT NULL)'
+            )
+            self._connection.execute(
+                'CREATE INDEX IF NOT EXISTS decisions_accessed '
+                'ON decisions (accessed)'
+            )
+            self._connection.execute(
+                'CREATE INDEX IF NOT EXISTS decisions_created '
+                'ON decisions (created)'
+            )
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS decisions_count ('
+                'n INTEGER NOT NULL)'
+            )
+            self._connection.execute(
+                'INSERT INTO decisions_count SELECT COUNT(*) FROM decisions '
+                'WHERE NOT EXISTS (SELECT 1 FROM decisions_count)'
+            )
+            self._connection.execute(
+                'CREATE TRIGGER IF NOT EXISTS decisions_insert '
+                'AFTER INSERT ON decisions BEGIN '
+                'UPDATE decisions_count SET n = n + 1; END'
+            )
+            self._connection.execute(
+                'CREATE TRIGGER IF NOT EXISTS decisions_delete '
+                'AFTER DELETE ON decisions BEGIN '
+                'UPDATE decisions_count SET n = n - 1; END'
+            )
+
+    def __enter__(self) -> 'DecisionCache':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of cached decisions."""
+        return self._connection.execute(
+            'SELECT n FROM decisions_count'
+        ).fetchone()[0]
+
+    def get(self, digest: str) -> Optional[Tuple[str, float]]:
+        """Get a cached decision.
+
+        Parameters
+        ----------
+        digest
+            The state digest computed by :func:`state_digest`.
+
+        Returns
+        -------
+        Optional[Tuple[str, float]]
+            The cached action and value estimate, ``None`` when missing or
+            expired.
+        """
+        now = self.clock()
+        row = self._connection.execute(
+            'SELECT action, value, created FROM decisions WHERE digest = ?',
+            (digest,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        action, value, created = row
+        if self.ttl is not None and now - created > self.ttl:
+            return None
+        self._touched[digest] = now
+        if len(self._touched) >= self.touch_batch:
+            self._try_flush_touches()
+        return action, value
+
+    def put(self, digest: str, action: str, value: float):
+        """Store a decision and evict stale entries.
+
+        Parameters
+        ----------
+        digest
+            The state digest computed by :func:`state_digest`.
+        action
+            The action chosen by the agent.
+        value
+            The value estimate of the state.
+        """
+        now = self.clock()
+        self._touched.pop(digest, None)
+        with self._connection:
+            self._connection.execute('BEGIN IMMEDIATE')
+            self._write_touches()
+            self._connection.execute(
+                'INSERT INTO decisions VALUES (?, ?, ?, ?, ?) '
+                'ON CONFLICT (digest) DO UPDATE SET '
+                'action = excluded.action, value = excluded.value, '
+                'created = excluded.created, accessed = excluded.accessed',
+                (digest, action, value, now, now)
+            )
+            if self.ttl is not None:
+                self._connection.execute(
+                    'DELETE FROM decisions WHERE created < ?',
+                    (now - self.ttl,)
+                )
+            excess = len(self) - self.max_entries
+            if excess > 0:
+                self._connection.execute(
+                    'DELETE FROM decisions WHERE digest IN ('
+                    'SELECT digest FROM decisions ORDER BY accessed LIMIT ?)',
+                    (excess + self.max_entries // 10,)
+                )
+
+    def _write_touches(self):
+        """Write the pending access times, within a transaction."""
+        if not self._touched:
+            return
+        self._connection.executemany(
+            'UPDATE decisions SET accessed = MAX(accessed, ?) '
+            'WHERE digest = ?',
+            [(accessed, digest) for digest, accessed in self._touched.items()]
+        )
+        self._touched.clear()
+
+    def _try_flush_touches(self):
+        """Write the pending access times unless the database is locked."""
+        if not self._touched:
+            return
+        self._connection.execute('PRAGMA busy_timeout = 0')
+        try:
+            with self._connection:
+                self._write_touches()
+        except sqlite3.OperationalError:
+            pass
+        finally:
+            self._connection.execute(
+                f'PRAGMA busy_timeout = {int(self.timeout * 1000)}'
+            )
+
+    def close(self):
+        """Close the database.
+
+        Pending access times are written unless the database is locked.
+        """
+        self._try_flush_touches()
+        self._connection.close()
@@ -0,0 +1,262 @@
+"""Columnar export module.
+
+Simulation results are written as ``.npy`` shards, one file per column and
+chunk, that can be loaded or memory mapped with ``numpy.load``::
+
+    <directory>/<table>/<column>-<shard>.npy
+
+Shard numbers are zero padded to five digits and grow wider past 99999,
+so shards must be ordered by their number rather than by name.
+
+The ``games`` table holds one row per game and the ``turns`` table one row
+per turn summary.  Rows are buffered in :mod:`array` columns and flushed
+every ``chunk_size`` rows, so the full tables are never held in memory.
+"""
+import ast
+import os
+import re
+import struct
+import sys
+from array import array
+from enum import Enum
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from nalone.board import AssimilationPosition, Board, RescuePosition
+from nalone.map import ArtemiaMap
+
+_NPY_MAGIC = b'\x93NUMPY\x01\x00'
+
+_DESCRS = {'B': '|u1', 'H': '<u2', 'Q': '<u8'}
+
+_GAME_COLUMNS = {
+    'game_id': 'Q',
+    'winner': 'B',
+    'board_type': 'B',
+    'number_of_players': 'B',
+    'rescue_position': 'B',
+    'assimilation_position': 'B',
+    'map_permutation': 'B',
+}
+
+_TURN_COLUMNS = {
+    'game_id': 'Q',
+    'turn': 'H',
+    'rescue_position': 'B',
+    'assimilation_position': 'B',
+}
+
+
+class Winner(Enum):
+    """Enumerator of the winning team of a game."""
+
+    HUNTED = 0
+    CREATURE = 1
+
+
+def _write_npy(path: str, column: array, shape: Tuple[int, ...]):
+    """Write a column into a ``.npy`` file."""
+    if column.itemsize > 1 and sys.byteorder == 'big':
+        column = array(column.typecode, column)
+        column.byteswap()
+    header = repr({
+        'descr': _DESCRS[column.typecode],
+        'fortran_order': False,
+        'shape': shape,
+    })
+    padding = -(len(_NPY_MAGIC) + 2 + len(header) + 1) % 64
+    header += ' ' * padding + '\n'
+    with open(path, 'wb') as file_:
+        file_.write(_NPY_MAGIC)
+        file_.write(struct.pack('<H', len(header)))
+        file_.write(header.encode('latin1'))
+        column.tofile(file_)
+
+
+def _read_npy(path: str) -> array:
+    """Read a flattened column from a ``.npy`` file."""
+    with open(path, 'rb') as file_:
+        if file_.read(len(_NPY_MAGIC)) != _NPY_MAGIC:
+            raise ValueError(f'Unsupported npy file {path}.')
+        header_length, = struct.unpack('<H', file_.read(2))
+        header = ast.literal_eval(file_.read(header_length).decode('latin1'))
+        typecode, = (
+            code for code, descr in _DESCRS.items()
+            if descr == header['descr']
+        )
+        size = 1
+        for dimension in header['shape']:
+            size *= dimension
+        column = array(typecode)
+        column.fromfile(file_, size)
+    if column.itemsize > 1 and sys.byteorder == 'big':
+        column.byteswap()
+    return column
+
+
+class _Table:
+    """A table buffered in columns and flushed in shards."""
+
+    def __init__(
+            self,
+            directory: str,
+            columns: Dict[str, str],
+            widths: Optional[Dict[str, int]] = None
+    ):
+        self.directory = directory
+        self.widths = widths or {}
+        self.columns = {
+            name: array(typecode) for name, typecode in columns.items()
+        }
+        self.rows = 0
+        self.shards = 0
+        os.makedirs(directory, exist_ok=True)
+        if os.listdir(directory):
+            raise FileExistsError(
+                f'Table directory {directory} is not empty, its shards would '
+                'be mixed with the new ones.'
+            )
+
+    def flush(self):
+        """Write the buffered rows as a new shard."""
+        if not self.rows:
+            return
+        for name, column in self.columns.items():
+            width = self.widths.get(name)
+            shape = (self.rows, width) if width else (self.rows,)
+            path = os.path.join(
+                self.directory, f'{name}-{self.shards:05d}.npy'
+            )
+            _write_npy(path, column, shape)
+            del column[:]
+        self.rows = 0
+        self.shards += 1
+
+
+class ColumnarExporter:
+    """Streaming exporter of simulation results into columnar shards.
+
+    Parameters
+    ----------
+    directory
+        The output directory, its ``games`` and ``turns`` table directories
+        must be missing or empty.
+    chunk_size
+        The number of rows of each shard.
+    """
+
+    def __init__(self, directory: str, chunk_size: int = 1_000_000):
+        if chunk_size < 1:
+            raise ValueError(
+                f'chunk_size must be positive. {chunk_size} was given.'
+            )
+        self.chunk_size = chunk_size
+        self._games = _Table(
+            os.path.join(directory, 'games'),
+            _GAME_COLUMNS,
+            {'map_permutation': 10},
+        )
+        self._turns = _Table(os.path.join(directory, 'turns'), _TURN_COLUMNS)
+        self._next_game_id = 0
+
+    def __enter__(self) -> 'ColumnarExporter':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def add_game(
+            self,
+            board: Board,
+            map_: ArtemiaMap,
+            winner: Winner,
+            rescue_position: RescuePosition,
+            assimilation_position: AssimilationPosition,
+            *,
+            turns: Iterable[Tuple[RescuePosition, AssimilationPosition]] = ()
+    ) -> int:
+        """Add the result of a game.
+
+        Parameters
+        ----------
+        board
+            The game board.
+        map_
+            The Artemia map.
+        winner
+            The winning team.
+        rescue_position
+            The final position of the rescue counter.
+        assimilation_position
+            The final position of the assimilation counter.
+        turns
+            The positions of the rescue and assimilation counters at the end
+            of each turn.
+
+        Returns
+        -------
+        int
+            The identifier of the game in the exported tables.
+        """
+        game_id = self._next_game_id
+        self._next_game_id += 1
+
+        columns = self._games.columns
+        columns['game_id'].append(game_id)
+        columns['winner'].append(Winner(winner).value)
+        columns['board_type'].append(board.type.value)
+        columns['number_of_players'].append(board.number_of_players)
+        columns['rescue_position'].append(rescue_position.value)
+        columns['assimilation_position'].append(assimilation_position.value)
+        columns['map_permutation'].extend(map_.permutation)
+        self._games.rows += 1
+        if self._games.rows >= self.chunk_size:
+            self._games.flush()
+
+        columns = self._turns.columns
+        for turn, (rescue, assimilation) in enumerate(turns, 1):
+            columns['game_id'].append(game_id)
+            columns['turn'].append(turn)
+            columns['rescue_position'].append(rescue.value)
+            columns['assimilation_position'].append(assimilation.value)
+            self._turns.rows += 1
+            if self._turns.rows >= self.chunk_size:
+                self._turns.flush()
+        return game_id
+
+    def close(self):
+        """Flush the remaining rows."""
+        self._games.flush()
+        self._turns.flush()
+
+
+def read_column(directory: str, table: str, column: str) -> array:
+    """Read an exported column without NumPy.
+
+    Parameters
+    ----------
+    directory
+        The export directory.
+    table
+        The table name, either ``'games'`` or ``'turns'``.
+    column
+        The column name.
+
+    Returns
+    -------
+    array
+        The concatenated shards of the column in shard number order, two
+        dimensional columns are flattened row by row.
+    """
+    table_directory = os.path.join(directory, table)
+    pattern = re.compile(rf'{re.escape(column)}-(\d+)\.npy')
+    shards: List[Tuple[int, str]] = []
+    for name in os.listdir(table_directory):
+        match = pattern.fullmatch(name)
+        if match:
+            shards.append((int(match.group(1)), name))
+    result = array(
+        _GAME_COLUMNS[column] if table == 'games' else _TURN_COLUMNS[column]
+    )
+    for _, name in sorted(shards):
+        result.extend(_read_npy(os.path.join(table_directory, name)))
+    return result
@@ -1,5 +1,6 @@
 """Map module."""
-from typing import Dict, Iterable, List, Optional
+from numbers import Integral
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 from copy import deepcopy
 
 from nalone.cards import MapPlaceCard
@@ -26,6 +27,26 @@ class ArtemiaMapSetUpError(ValueError):
         return res
 
 
+def _build_graph() -> Dict[int, List[int]]:
+    """Build the adjacency of the 2 x 5 map grid by card index."""
+    graph: Dict[int, List[int]] = {}
+    for i in range(10):
+        vertical_neighbor = i + 5 if i < 5 else i - 5
+        if i in (0, 5):
+            horizontal_neighbors = [i + 1]
+        elif i in (4, 9):
+            horizontal_neighbors = [i - 1]
+        else:
+            horizontal_neighbors = [i - 1, i + 1]
+        graph.setdefault(i, []).extend(
+            [*horizontal_neighbors, vertical_neighbor]
+        )
+    return graph
+
+
+_GRAPH = _build_graph()
+
+
 class ArtemiaMap:
     """The Artemia map class."""
 
@@ -45,23 +66,70 @@ class ArtemiaMap:
             )
 
         map_ = cls()
-        graph: Dict[int, List[int]] = dict()
-        for i in range(10):
-            vertical_neighbor = i + 5 if i < 5 else i - 5
-            if i in (0, 5):
-                horizontal_neighbors = [i + 1]
-            elif i in (4, 9):
-                horizontal_neighbors = [i - 1]
-            else:
-                horizontal_neighbors = [i - 1, i + 1]
-            graph.setdefault(i, []).extend(
-                [*horizontal_neighbors, vertical_neighbor]
-            )
-
-        map_._graph = graph
+        map_._graph = _GRAPH
         map_._cards = deepcopy(cards)
         return map_
 
+    @classmethod
+    def from_permutations(
+            cls,
+            permutations: Iterable[Sequence[int]]
+    ) -> List['ArtemiaMap']:
+        """Initialize many maps from permutations of place card numbers.
+
+        All the permutations are validated before any map is built.
+
+        Parameters
+        ----------
+        permutations
+            An iterable of integer sequences, each one holding the numbers 1
+            to 10 in the order the place cards are laid on the map.
+
+        Returns
+        -------
+        List[ArtemiaMap]
+            The constructed maps, in the order of ``permutations``.
+        """
+        # pylint: disable=protected-access
+        expected = tuple(range(1, 11))
+        checked = []
+        for i, permutation in enumerate(permutations):
+            permutation = tuple(permutation)
+            if not all(
+                    isinstance(number, Integral) and
+                    not isinstance(number, bool)
+                    for number in permutation
+            ):
+                raise ArtemiaMapSetUpError(
+                    f': Permutation {i} must only hold integers. '
+                    f'{permutation} was given.'
+                )
+            numbers = tuple(map(int, permutation))
+            if tuple(sorted(numbers)) != expected:
+                raise ArtemiaMapSetUpError(
+                    f': Permutation {i} must contain each place card number '
+                    f'from 1 to 10 exactly once. {permutation} was given.'
+                )
+            checked.append(numbers)
+
+        maps = []
+        for permutation in checked:
+            cards = []
+            for number in permutation:
+                card = MapPlaceCard()
+                card.number = number
+                cards.append(card)
+            map_ = cls()
+            map_._graph = _GRAPH
+            map_._cards = cards
+            maps.append(map_)
+        return maps
+
+    @property
+    def permutation(self) -> Tuple[int, ...]:
+        """Get the place card numbers in their order on the map."""
+        return tuple(card.number for card in self._cards)
+
     def _get_card_index(self, id_: int) -> int:
         """Get map place card index by id."""
         for i, card in enumerate(self._cards):
@@ -0,0 +1,252 @@
+"""Legal moves module."""
+from enum import Enum
+from typing import (Dict, Generic, Hashable, Iterable, Iterator, List,
+                    NamedTuple, Optional, Sequence, TypeVar)
+
+from nalone.board import RescuePosition, RescuePositionType
+
+T = TypeVar('T', bound=Hashable)
+
+
+class MoveBuffer(Generic[T]):
+    """A preallocated buffer of moves.
+
+    Moves are added and removed in constant time by swapping the removed move
+    with the last one, hence the order of the moves is not preserved.
+
+    Parameters
+    ----------
+    capacity
+        The maximum number of moves held by the buffer.
+    """
+
+    def __init__(self, capacity: int):
+        self._moves: List[Optional[T]] = [None] * capacity
+        self._slots: Dict[T, int] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[T]:
+        for i in range(self._size):
+            yield self._moves[i]  # type: ignore
+
+    def __getitem__(self, index: int) -> T:
+        if not -self._size <= index < self._size:
+            raise IndexError(f'Move index out of range: {index}')
+        return self._moves[index % self._size]  # type: ignore
+
+    def __contains__(self, move) -> bool:
+        return move in self._slots
+
+    def add(self, move: T):
+        """Add a move to the buffer if not already present.
+
+        Parameters
+        ----------
+        move
+            The move to be added.
+        """
+        if move in self._slots:
+            return
+        if self._size == len(self._moves):
+            raise OverflowError('Move buffer is full.')
+        self._moves[self._size] = move
+        self._slots[move] = self._size
+        self._size += 1
+
+    def discard(self, move: T):
+        """Remove a move from the buffer if present.
+
+        Parameters
+        ----------
+        move
+            The move to be removed.
+        """
+        slot = self._slots.pop(move, None)
+        if slot is None:
+            return
+        self._size -= 1
+        last = self._moves[self._size]
+        self._moves[self._size] = None
+        if slot != self._size:
+            self._moves[slot] = last
+            self._slots[last] = slot  # type: ignore
+
+
+class HuntToken(Enum):
+    """Enumerator of the hunt tokens placed by the creature.
+
+    - ``CREATURE`` is available every turn.
+
+    - ``ARTEMIA`` is available while the rescue counter stands on an Artemia
+      position.
+    """
+
+    CREATURE = 0
+    ARTEMIA = 1
+
+
+class Placement(NamedTuple):
+    """The placement of a hunt token on a map place."""
+
+    token: HuntToken
+    place: int
+
+
+class MoveGenerator:
+    """Incremental generator of legal moves.
+
+    The moves of the exploration phase are the place cards each hunted player
+    can play, those of the hunting phase are the hunt token placements of the
+    creature.  Each list lives in a :class:`MoveBuffer` that is updated from
+    the effect of the last action rather than rebuilt, and the same buffer is
+    returned on every call.
+
+    Parameters
+    ----------
+    hands
+        The place card numbers in the hand of each hunted player.
+    """
+
+    def __init__(self, hands: Sequence[Iterable[int]]):
+        self._placements = {
+            token: tuple(Placement(token, place) for place in range(1, 11))
+            for token in HuntToken
+        }
+        self._exploration_moves: List[MoveBuffer[int]] = []
+        for hand in hands:
+            buffer: MoveBuffer[int] = MoveBuffer(10)
+            for card_number in hand:
+                buffer.add(self._check_card_number(card_number))
+            self._exploration_moves.append(buffer)
+
+        self._hunting_moves: MoveBuffer[Placement] = MoveBuffer(
+            10 * len(HuntToken)
+        )
+        self._placed = {token: False for token in HuntToken}
+        self._artemia = False
+        self._add_placements(HuntToken.CREATURE)
+
+    @staticmethod
+    def _check_card_number(card_number: int) -> int:
+        """Check that a place card number is legal."""
+        if not 1 <= card_number <= 10:
+            raise ValueError(
+                f'Place card number must be between 1 and 10 {card_number} '
+                'was given.'
+            )
+        return card_number
+
+    def _available(self, token: HuntToken) -> bool:
+        """Check whether a hunt token can be placed."""
+        if self._placed[token]:
+            return False
+        return token != HuntToken.ARTEMIA or self._artemia
+
+    def _add_placements(self, token: HuntToken):
+        """Add the placements of a hunt token to the hunting moves."""
+        for placement in self._placements[token]:
+            self._hunting_moves.add(placement)
+
+    def _discard_placements(self, token: HuntToken):
+        """Remove the placements of a hunt token from the hunting moves."""
+        for placement in self._placements[token]:
+            self._hunting_moves.discard(placement)
+
+    def exploration_moves(self, player: int) -> MoveBuffer[int]:
+        """Get the place cards a hunted player can play.
+
+        Parameters
+        ----------
+        player
+            The index of the hunted player.
+
+        Returns
+        -------
+        MoveBuffer[int]
+            The playable place card numbers.
+        """
+        return self._exploration_moves[player]
+
+    def hunting_moves(self) -> MoveBuffer[Placement]:
+        """Get the hunt token placements the creature can make.
+
+        Returns
+        -------
+        MoveBuffer[Placement]
+            The legal placements.
+        """
+        return self._hunting_moves
+
+    def play_card(self, player: int, card_number: int):
+        """Update the moves after a hunted player played a place card.
+
+        Parameters
+        ----------
+        player
+            The index of the hunted player.
+        card_number
+            The number of the played place card.
+        """
+        moves = self._exploration_moves[player]
+        if card_number not in moves:
+            raise ValueError(
+                f'Place card {card_number} is not in the hand of player '
+                f'{player}.'
+            )
+        moves.discard(card_number)
+
+    def take_back_cards(self, player: int, card_numbers: Iterable[int]):
+        """Update the moves after a hunted player took place cards back.
+
+        Parameters
+        ----------
+        player
+            The index of the hunted player.
+        card_numbers
+            The numbers of the place cards taken back in hand.
+        """
+        moves = self._exploration_moves[player]
+        for card_number in card_numbers:
+            moves.add(self._check_card_number(card_number))
+
+    def place_token(self, token: HuntToken):
+        """Update the moves after the creature placed a hunt token.
+
+        Parameters
+        ----------
+        token
+            The placed hunt token.
+        """
+        if not self._available(token):
+            raise ValueError(f'Hunt token {token.name} cannot be placed.')
+        self._placed[token] = True
+        self._discard_placements(token)
+
+    def move_rescue_counter(self, position: RescuePosition):
+        """Update the moves after the rescue counter moved.
+
+        Parameters
+        ----------
+        position
+            The new position of the rescue counter.
+        """
+        artemia = position.type == RescuePositionType.ARTEMIA
+        if artemia == self._artemia:
+            return
+        self._artemia = artemia
+        if not self._placed[HuntToken.ARTEMIA]:
+            if artemia:
+                self._add_placements(HuntToken.ARTEMIA)
+            else:
+                self._discard_placements(HuntToken.ARTEMIA)
+
+    def new_turn(self):
+        """Update the moves at the start of a new turn."""
+        for token in HuntToken:
+            if self._placed[token]:
+                self._placed[token] = False
+                if self._available(token):
+                    self._add_placements(token)
@@ -0,0 +1,371 @@
+"""Replay and throughput harness module.
+
+Run ``python -m nalone.replay --help`` for the command line interface.
+"""
+import argparse
+import hashlib
+import random
+import sys
+import time
+import tracemalloc
+from enum import Enum
+from typing import (Dict, Iterable, List, NamedTuple, Optional, Sequence,
+                    Tuple, Union)
+
+from nalone.board import Board, BoardType, Track
+from nalone.map import ArtemiaMap
+
+
+class ActionKind(Enum):
+    """Enumerator of replayable action kinds.
+
+    - ``RESCUE`` moves the rescue counter by the given number of steps.
+
+    - ``ASSIMILATION`` moves the assimilation counter by the given number of
+      steps.
+
+    - ``NEIGHBORS`` queries the neighbors of the given map place card.
+    """
+
+    RESCUE = 0
+    ASSIMILATION = 1
+    NEIGHBORS = 2
+
+
+class Action(NamedTuple):
+    """A replayable action."""
+
+    kind: ActionKind
+    argument: int
+
+
+class ReplayReport(NamedTuple):
+    """The results of a replay benchmark.
+
+    Attributes
+    ----------
+    turns
+        The number of replayed turns per run.
+    states_per_second
+        The best throughput observed among the timed runs.
+    peak_bytes_per_turn
+        The mean over the turns of the peak memory allocated while playing a
+        turn, measured with ``tracemalloc``.
+    max_peak_bytes
+        The largest peak memory allocated while playing a single turn.
+    latency_histogram
+        The number of turns per latency bucket, keyed by the bucket upper
+        bound in nanoseconds.
+    digests
+        The final state digest of every run.
+    """
+
+    turns: int
+    states_per_second: float
+    peak_bytes_per_turn: float
+    max_peak_bytes: int
+    latency_histogram: Dict[int, int]
+    digests: Tuple[str, ...]
+
+    @property
+    def deterministic(self) -> bool:
+        """Check whether every run reached the same final state."""
+        return len(set(self.digests)) == 1
+
+
+def random_actions(
+        number_of_turns: int,
+        seed: Optional[int] = None
+) -> List[Action]:
+    """Generate a random action stream.
+
+    Parameters
+    ----------
+    number_of_turns
+        The number of actions to generate.
+    seed
+        An optional seed making the stream reproducible.
+
+    Returns
+    -------
+    List[Action]
+        The generated actions.
+    """
+    rng = random.Random(seed)
+    actions = []
+    for _ in range(number_of_turns):
+        kind = rng.choice(tuple(ActionKind))
+        if kind == ActionKind.NEIGHBORS:
+            argument = rng.randint(1, 10)
+        else:
+            argument = rng.randint(-2, 2)
+        actions.append(Action(kind, argument))
+    return actions
+
+
+def dump_actions(actions: Iterable[Action], path: str):
+    """Write an action stream into a file.
+
+    Each line holds the kind name and the argument of one action, for
+    instance ``RESCUE -2`` or ``NEIGHBORS 7``.
+
+    Parameters
+    ----------
+    actions
+        The actions to write.
+    path
+        The path of the file.
+    """
+    with open(path, 'w', encoding='ascii') as file_:
+        for action in actions:
+            file_.write(f'{action.kind.name} {action.argument}\n')
+
+
+def load_actions(path: str) -> List[Action]:
+    """Read an action stream written by :func:`dump_actions`.
+
+    Blank lines are skipped.
+
+    Parameters
+    ----------
+    path
+        The path of the file.
+
+    Returns
+    -------
+    List[Action]
+        The read actions.
+    """
+    actions = []
+    with open(path, encoding='ascii') as file_:
+        for line_number, line in enumerate(file_, 1):
+            if not line.strip():
+                continue
+            try:
+                kind, argument = line.split()
+                actions.append(Action(ActionKind[kind], int(argument)))
+            except (KeyError, ValueError):
+                raise ValueError(
+                    f'Invalid action on line {line_number} of {path}: '
+                    f'{line.strip()!r}'
+                ) from None
+    return actions
+
+
+class _Replay:
+    """The state of a replayed game."""
+
+    def __init__(self, board: Board, map_: ArtemiaMap):
+        self.board = board
+        self.map = map_
+        self.rescue = board.rescue_track.head
+        self.assimilation = board.assimilation_track.head
+        self.queries = hashlib.sha256()
+
+    def step(self, action: Action):
+        """Apply one action."""
+        if action.kind == ActionKind.RESCUE:
+            self.rescue = Track.move(self.rescue, action.argument)
+        elif action.kind == ActionKind.ASSIMILATION:
+            self.assimilation = Track.move(self.assimilation, action.argument)
+        else:
+            self.queries.update(bytes(
+                card.number
+                for card in self.map.get_neighbors_by_id(action.argument)
+            ))
+
+    def digest(self) -> str:
+        """Compute the digest of the current state."""
+        key = (
+            self.board.number_of_players,
+            self.board.type.value,
+            self.map.permutation,
+            self.rescue.value,
+            self.assimilation.value,
+            self.queries.hexdigest(),
+        )
+        return hashlib.sha256(repr(key).encode()).hexdigest()
+
+
+def replay(
+        board: Board,
+        map_: ArtemiaMap,
+        actions: Iterable[Action]
+) -> str:
+    """Replay an action stream from the start of a game.
+
+    Parameters
+    ----------
+    board
+        The game board, counters start on the first position of each track.
+    map_
+        The Artemia map.
+    actions
+        The actions to replay.
+
+    Returns
+    -------
+    str
+        The hexadecimal digest of the final state.
+    """
+    state = _Replay(board, map_)
+    for action in actions:
+        state.step(action)
+    return state.digest()
+
+
+def _bucket(latency: int) -> int:
+    """Get the power of two upper bound of a latency in nanoseconds."""
+    return 1 << max(latency - 1, 0).bit_length()
+
+
+def benchmark(
+        actions: Sequence[Action],
+        number_of_players: int = 4,
+        board_type: Union[BoardType, int] = BoardType.STACKED,
+        permutation: Sequence[int] = tuple(range(1, 11)),
+        runs: int = 3
+) -> ReplayReport:
+    """Benchmark the replay of an action stream.
+
+    Each pass replays the stream on a freshly built board and map.  The
+    throughput comes from the timed runs, which carry no per-turn
+    instrumentation.  Two more passes follow: one times every turn to build
+    the latency histogram, and one traces every turn with ``tracemalloc``.
+
+    Parameters
+    ----------
+    actions
+        The actions to replay.
+    number_of_players
+        The number of players in the game.
+    board_type
+        The board type.
+    permutation
+        The place card numbers in their order on the map.
+    runs
+        The number of timed runs.
+
+    Returns
+    -------
+    ReplayReport
+        The benchmark results.
+    """
+    if runs < 1:
+        raise ValueError(f'runs must be positive. {runs} was given.')
+
+    def new_replay() -> _Replay:
+        board = Board(number_of_players, board_type)
+        map_ = ArtemiaMap.from_permutations([permutation])[0]
+        return _Replay(board, map_)
+
+    digests = []
+    best = float('inf')
+    clock = time.perf_counter_ns
+    for _ in range(runs):
+        state = new_replay()
+        step = state.step
+        start = clock()
+        for action in actions:
+            step(action)
+        best = min(best, clock() - start)
+        digests.append(state.digest())
+
+    histogram: Dict[int, int] = {}
+    state = new_replay()
+    for action in actions:
+        start = clock()
+        state.step(action)
+        bucket = _bucket(clock() - start)
+        histogram[bucket] = histogram.get(bucket, 0) + 1
+    digests.append(state.digest())
+
+    total_peak = max_peak = 0
+    state = new_replay()
+    tracemalloc.start()
+    try:
+        for action in actions:
+            tracemalloc.clear_traces()
+            state.step(action)
+            peak = tracemalloc.get_traced_memory()[1]
+            total_peak += peak
+            max_peak = max(max_peak, peak)
+    finally:
+        tracemalloc.stop()
+    digests.append(state.digest())
+
+    turns = len(actions)
+    return ReplayReport(
+        turns=turns,
+        states_per_second=turns * 1e9 / best if best else float('inf'),
+        peak_bytes_per_turn=total_peak / turns if turns else 0.0,
+        max_peak_bytes=max_peak,
+        latency_histogram=dict(sorted(histogram.items())),
+        digests=tuple(digests),
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the benchmark from the command line.
+
+    Parameters
+    ----------
+    argv
+        The command line arguments, defaults to ``sys.argv[1:]``.
+
+    Returns
+    -------
+    int
+        The exit status, non zero when the runs are not deterministic.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m nalone.replay',
+        description='Replay action streams and report throughput.'
+    )
+    parser.add_argument(
+        '--actions', metavar='PATH',
+        help='replay the recorded stream in PATH instead of a random one'
+    )
+    parser.add_argument(
+        '--dump-actions', metavar='PATH',
+        help='record the replayed stream into PATH'
+    )
+    parser.add_argument('--turns', type=int, default=100_000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--players', type=int, default=4)
+    parser.add_argument(
+        '--board-type', type=int, default=BoardType.STACKED.value,
+        choices=[board_type.value for board_type in BoardType]
+    )
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    if args.actions:
+        actions = load_actions(args.actions)
+    else:
+        actions = random_actions(args.turns, args.seed)
+    if args.dump_actions:
+        dump_actions(actions, args.dump_actions)
+
+    report = benchmark(
+        actions,
+        number_of_players=args.players,
+        board_type=args.board_type,
+        runs=args.runs,
+    )
+    print(f'turns: {report.turns}')
+    print(f'states per second: {report.states_per_second:.0f}')
+    print(f'peak bytes per turn: {report.peak_bytes_per_turn:.1f}')
+    print(f'max peak bytes: {report.max_peak_bytes}')
+    print('latency histogram (ns):')
+    for bucket, count in report.latency_histogram.items():
+        print(f'  <= {bucket}: {count}')
+    print(f'final state: {report.digests[0]}')
+    if not report.deterministic:
+        print('error: final states differ across runs', file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,7 +4,7 @@ import pytest
 from nalone.board import (AssimilationPosition, AssimilationTrack, Board,
                           BoardType, NumberOfPlayersError, PositionError,
                           RescuePosition, RescuePositionType, RescueTrack,
-                          assert_number_of_players)
+                          Track, assert_number_of_players)
 
 
 @pytest.mark.parametrize(
@@ -117,3 +117,74 @@ def test_board_initialization():
     assert board.type == board_type
     assert board.assimilation_track_length == 9
     assert board.rescue_track_length == 15
+
+
+def test_board_many():
+    """Test :meth:`nalone.board.Board.many`."""
+    # pylint: disable=protected-access
+    specs = [(4, BoardType.STACKED), (2, 2), (4, BoardType.STACKED)]
+    boards = Board.many(specs)
+
+    assert len(boards) == len(specs)
+    for board, (number_of_players, board_type) in zip(boards, specs):
+        expected = Board(number_of_players, board_type)
+        assert board.number_of_players == expected.number_of_players
+        assert board.type == expected.type
+        assert board._rescue_track == expected._rescue_track
+        assert board._assimilation_track == expected._assimilation_track
+    assert boards[0]._rescue_track.head is not boards[2]._rescue_track.head
+
+
+@pytest.mark.parametrize(
+    'track_class, board_type',
+    [(RescueTrack, BoardType.ALTERNATING), (AssimilationTrack, 1)]
+)
+def test_track_copy(track_class, board_type):
+    """Test :meth:`nalone.board.Track.copy`."""
+    track = track_class.construct(5, board_type)
+    copied = track.copy()
+
+    assert isinstance(copied, track_class)
+    assert copied == track
+    assert copied.head is not track.head
+    assert copied.tail.value == len(track) - 1
+    assert Track.move(copied.tail, -len(track)) is copied.head
+
+    copied.append_by_id(len(track))
+    assert copied != track
+    assert track.tail.next is None
+
+
+@pytest.mark.parametrize(
+    'specs', [[(4, 1), (8, 1)], [(3, 1), (3, 5)]]
+)
+def test_board_many_wrong_input(specs):
+    """Test wrong input for :meth:`nalone.board.Board.many`."""
+    with pytest.raises(ValueError):
+        _ = Board.many(specs)
+
+
+def test_board_many_unhashable_specs():
+    """Test :meth:`nalone.board.Board.many` with list specs."""
+    boards = Board.many([[4, 1], [4, BoardType.STACKED], [2, 2]])
+
+    assert [board.number_of_players for board in boards] == [4, 4, 2]
+    assert [board.type for board in boards] == [
+        BoardType.STACKED, BoardType.STACKED, BoardType.ALTERNATING
+    ]
+    assert boards[0].rescue_track == boards[1].rescue_track
+    assert boards[0].rescue_track.head is not boards[1].rescue_track.head
+
+
+@pytest.mark.parametrize(
+    'start, steps, expected',
+    [(0, 3, 3), (3, -2, 1), (2, 0, 2), (12, 5, 13), (1, -4, 0)]
+)
+def test_track_move(start, steps, expected):
+    """Test :meth:`nalone.board.Track.move`."""
+    track = Board(3).rescue_track
+    position = track.head
+    for _ in range(start):
+        position = position.next
+
+    assert Track.move(position, steps).value == expected
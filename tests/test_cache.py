@@ -0,0 +1,152 @@
+"""Unit tests for :mod:`nalone.cache`."""
+import itertools
+import sqlite3
+
+import pytest
+
+from nalone.board import Board, BoardType
+from nalone.cache import DecisionCache, canonical_map_layout, state_digest
+from nalone.cards import MapPlaceCard
+from nalone.map import ArtemiaMap
+
+
+@pytest.fixture
+def clock():
+    """Create fixture for a cache clock ticking one second per call."""
+    ticks = itertools.count()
+    return lambda: float(next(ticks))
+
+
+@pytest.mark.parametrize(
+    'permutation',
+    [
+        (5, 4, 3, 2, 1, 10, 9, 8, 7, 6),
+        (6, 7, 8, 9, 10, 1, 2, 3, 4, 5),
+        (10, 9, 8, 7, 6, 5, 4, 3, 2, 1),
+    ]
+)
+def test_state_digest_map_symmetries(permutation):
+    """Test :func:`nalone.cache.state_digest` on symmetric maps."""
+    board = Board(3, BoardType.STACKED)
+    maps = ArtemiaMap.from_permutations([range(1, 11), permutation])
+    hands = [[1, 2, 3, 4, 5], [5, 4, 3, 2, 1]]
+
+    assert canonical_map_layout(maps[1]) == tuple(range(1, 11))
+    digest = state_digest(board, maps[1], hands, 1)
+    assert digest == state_digest(board, maps[0], hands, 1)
+    assert digest != state_digest(board, maps[0], hands, 0)
+
+
+def test_state_digest_distinct_states():
+    """Test :func:`nalone.cache.state_digest` on distinct states."""
+    map_, other_map = map(ArtemiaMap.from_place_cards, [
+        [MapPlaceCard.from_int(i) for i in range(1, 11)],
+        [MapPlaceCard.from_int(i) for i in (1, 2, 3, 4, 5, 7, 9, 10, 6, 8)],
+    ])
+    hands = [[1, 2, 3, 4, 5]]
+    digests = {
+        state_digest(Board(3), map_, hands, 0),
+        state_digest(Board(4), map_, hands, 0),
+        state_digest(Board(3, BoardType.ALTERNATING), map_, hands, 0),
+        state_digest(Board(3), other_map, hands, 0),
+        state_digest(Board(3), map_, [[1, 2, 3, 4, 6]], 0),
+        state_digest(Board(3), map_, hands, 1),
+    }
+    assert len(digests) == 6
+
+
+def test_decision_cache(tmp_path):
+    """Test :class:`nalone.cache.DecisionCache`."""
+    path = str(tmp_path / 'decisions.sqlite')
+    with DecisionCache(path) as decisions:
+        assert decisions.get('a') is None
+        decisions.put('a', 'play 3', 0.5)
+        decisions.put('a', 'play 4', 0.25)
+        assert decisions.get('a') == ('play 4', 0.25)
+
+    with DecisionCache(path) as decisions:
+        assert len(decisions) == 1
+        assert decisions.get('a') == ('play 4', 0.25)
+
+
+def test_decision_cache_lru_eviction(tmp_path, clock):
+    """Test least recently used eviction of the decision cache."""
+    with DecisionCache(
+            str(tmp_path / 'lru.sqlite'), 2, clock=clock
+    ) as decisions:
+        decisions.put('a', 'play 1', 0.0)
+        decisions.put('b', 'play 2', 0.0)
+        assert decisions.get('a') is not None
+        decisions.put('c', 'play 3', 0.0)
+
+        assert len(decisions) == 2
+        assert decisions.get('b') is None
+        assert decisions.get('a') is not None
+        assert decisions.get('c') is not None
+
+
+def test_decision_cache_ttl_eviction(tmp_path, clock):
+    """Test time to live eviction of the decision cache."""
+    with DecisionCache(
+            str(tmp_path / 'ttl.sqlite'), ttl=1, clock=clock
+    ) as decisions:
+        decisions.put('a', 'play 1', 0.0)
+        assert decisions.get('a') is not None
+        assert decisions.get('a') is None
+        decisions.put('b', 'play 2', 0.0)
+        assert len(decisions) == 1
+
+
+def test_decision_cache_batch_eviction(tmp_path, clock):
+    """Test that the decision cache evicts down to 90% of its limit."""
+    with DecisionCache(
+            str(tmp_path / 'batch.sqlite'), 20, clock=clock
+    ) as decisions:
+        for i in range(21):
+            decisions.put(str(i), 'play 1', 0.0)
+        assert len(decisions) == 18
+        assert decisions.get('2') is None
+        assert decisions.get('3') is not None
+
+
+def test_decision_cache_concurrent_reader(tmp_path):
+    """Test reading the decision cache while another process writes."""
+    path = str(tmp_path / 'concurrent.sqlite')
+    with DecisionCache(path) as writer:
+        writer.put('a', 'play 1', 0.5)
+        writer.put('b', 'play 2', 0.5)
+
+    with DecisionCache(path, timeout=0.1, touch_batch=1) as reader:
+        locker = sqlite3.connect(path)
+        locker.execute('BEGIN IMMEDIATE')
+        locker.execute(
+            "INSERT INTO decisions VALUES ('c', 'play 3', 0.5, 0.0, 0.0)"
+        )
+        assert reader.get('a') == ('play 1', 0.5)
+        assert reader.get('c') is None
+        locker.commit()
+        locker.close()
+        assert reader.get('c') == ('play 3', 0.5)
+
+    with DecisionCache(path, max_entries=3) as decisions:
+        decisions.put('d', 'play 4', 0.5)
+        assert decisions.get('a') == ('play 1', 0.5)
+        assert decisions.get('b') is None
+
+
+def test_decision_cache_shared_limit(tmp_path, clock):
+    """Test the size limit of decision caches sharing a database."""
+    path = str(tmp_path / 'shared.sqlite')
+    with DecisionCache(path, 10, clock=clock) as first, \
+            DecisionCache(path, 10, clock=clock) as second:
+        for i in range(10):
+            first.put(f'first {i}', 'play 1', 0.0)
+            second.put(f'second {i}', 'play 2', 0.0)
+        first.put('first 0', 'play 3', 0.0)
+
+        assert len(first) == len(second) <= 10
+        count = first._connection.execute(  # pylint: disable=protected-access
+            'SELECT COUNT(*) FROM decisions'
+        ).fetchone()[0]
+        assert count == len(first)
+        assert second.get('first 0') == ('play 3', 0.0)
@@ -0,0 +1,99 @@
+"""Unit tests for :mod:`nalone.export`."""
+import os
+from array import array
+
+import pytest
+
+from nalone.board import Board, BoardType, Track
+from nalone.export import ColumnarExporter, Winner, _write_npy, read_column
+from nalone.map import ArtemiaMap
+
+
+def test_columnar_exporter(tmp_path):
+    """Test :class:`nalone.export.ColumnarExporter`."""
+    directory = str(tmp_path)
+    boards = Board.many([(2, BoardType.STACKED), (5, BoardType.ALTERNATING)])
+    maps = ArtemiaMap.from_permutations(
+        [range(1, 11), (1, 2, 3, 4, 5, 7, 9, 10, 6, 8)]
+    )
+    with ColumnarExporter(directory, chunk_size=2) as exporter:
+        for i in range(3):
+            board, map_ = boards[i % 2], maps[i % 2]
+            rescue = board.rescue_track.head
+            assimilation = board.assimilation_track.head
+            turns = []
+            for _ in range(i + 1):
+                rescue = Track.move(rescue, 2)
+                assimilation = Track.move(assimilation, 1)
+                turns.append((rescue, assimilation))
+            game_id = exporter.add_game(
+                board, map_, Winner(i % 2), rescue, assimilation,
+                turns=turns
+            )
+            assert game_id == i
+
+    games = os.listdir(os.path.join(directory, 'games'))
+    assert sorted(name for name in games if name.startswith('winner')) == [
+        'winner-00000.npy', 'winner-00001.npy'
+    ]
+    for name in games:
+        with open(os.path.join(directory, 'games', name), 'rb') as file_:
+            header_length = int.from_bytes(file_.read(10)[8:], 'little')
+        assert (10 + header_length) % 64 == 0
+
+    assert list(read_column(directory, 'games', 'game_id')) == [0, 1, 2]
+    assert list(read_column(directory, 'games', 'winner')) == [0, 1, 0]
+    assert list(read_column(directory, 'games', 'board_type')) == [1, 2, 1]
+    assert list(
+        read_column(directory, 'games', 'number_of_players')
+    ) == [2, 5, 2]
+    assert list(
+        read_column(directory, 'games', 'rescue_position')
+    ) == [2, 4, 6]
+    assert list(
+        read_column(directory, 'games', 'map_permutation')
+    ) == [*range(1, 11), 1, 2, 3, 4, 5, 7, 9, 10, 6, 8, *range(1, 11)]
+    assert list(
+        read_column(directory, 'turns', 'game_id')
+    ) == [0, 1, 1, 2, 2, 2]
+    assert list(read_column(directory, 'turns', 'turn')) == [1, 1, 2, 1, 2, 3]
+    assert list(
+        read_column(directory, 'turns', 'assimilation_position')
+    ) == [1, 1, 2, 1, 2, 3]
+
+
+def test_columnar_exporter_wrong_chunk_size(tmp_path):
+    """Test wrong chunk size for :class:`nalone.export.ColumnarExporter`."""
+    with pytest.raises(ValueError):
+        _ = ColumnarExporter(str(tmp_path), chunk_size=0)
+
+
+def test_columnar_exporter_existing_shards(tmp_path):
+    """Test exporting into a directory holding previous shards."""
+    directory = str(tmp_path)
+    board = Board(3)
+    map_ = ArtemiaMap.from_permutations([range(1, 11)])[0]
+    with ColumnarExporter(directory) as exporter:
+        exporter.add_game(
+            board, map_, Winner.HUNTED, board.rescue_track.head,
+            board.assimilation_track.head
+        )
+
+    with pytest.raises(FileExistsError):
+        _ = ColumnarExporter(directory)
+    assert list(read_column(directory, 'games', 'game_id')) == [0]
+
+
+def test_read_column_shard_order(tmp_path):
+    """Test :func:`nalone.export.read_column` past 99999 shards."""
+    games = tmp_path / 'games'
+    games.mkdir()
+    for shard in (100000, 99999, 2):
+        _write_npy(
+            str(games / f'game_id-{shard:05d}.npy'), array('Q', [shard]), (1,)
+        )
+    _write_npy(str(games / 'game_id-x.npy'), array('Q', [7]), (1,))
+
+    assert list(read_column(str(tmp_path), 'games', 'game_id')) == [
+        2, 99999, 100000
+    ]
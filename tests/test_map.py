@@ -58,3 +58,36 @@ def test_map_from_place_cards(
     neighbors = set(map_.get_neighbors(card))
     assert neighbors == expected_neighbors
     assert True
+
+
+def test_map_from_permutations(unordered_map_place_cards):
+    """Test :meth:`nalone.map.ArtemiaMap.from_permutations`."""
+    permutations = [range(1, 11), (1, 2, 3, 4, 5, 7, 9, 10, 6, 8)]
+    maps = ArtemiaMap.from_permutations(permutations)
+    expected = ArtemiaMap.from_place_cards(unordered_map_place_cards)
+
+    assert len(maps) == 2
+    assert all(isinstance(map_, ArtemiaMap) for map_ in maps)
+    for card_index in range(1, 11):
+        card = MapPlaceCard.from_int(card_index)
+        neighbors = set(maps[1].get_neighbors(card))
+        assert neighbors == set(expected.get_neighbors(card))
+    assert set(maps[0].get_neighbors_by_id(9)) == set(
+        map(MapPlaceCard.from_int, [8, 10, 4])
+    )
+
+
+@pytest.mark.parametrize(
+    'permutation',
+    [
+        range(1, 10),
+        [1, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+        range(2, 12),
+        [1.0, 2, 3, 4, 5, 6, 7, 8, 9, 10],
+        [True, 2, 3, 4, 5, 6, 7, 8, 9, 10],
+    ]
+)
+def test_map_from_permutations_wrong_input(permutation):
+    """Test wrong input for :meth:`ArtemiaMap.from_permutations`."""
+    with pytest.raises(ArtemiaMapSetUpError):
+        _ = ArtemiaMap.from_permutations([range(1, 11), permutation])
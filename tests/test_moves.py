@@ -0,0 +1,74 @@
+"""Unit tests for :mod:`nalone.moves`."""
+import pytest
+
+from nalone.board import Board, BoardType, Track
+from nalone.moves import HuntToken, MoveBuffer, MoveGenerator, Placement
+
+
+def test_move_buffer():
+    """Test :class:`nalone.moves.MoveBuffer`."""
+    buffer: MoveBuffer[int] = MoveBuffer(3)
+    for move in (1, 2, 3, 2):
+        buffer.add(move)
+
+    assert len(buffer) == 3
+    assert set(buffer) == {1, 2, 3}
+    with pytest.raises(OverflowError):
+        buffer.add(4)
+
+    buffer.discard(1)
+    buffer.discard(5)
+    assert len(buffer) == 2
+    assert 1 not in buffer
+    assert {buffer[0], buffer[-1]} == {2, 3}
+    with pytest.raises(IndexError):
+        _ = buffer[2]
+
+    buffer.add(4)
+    assert set(buffer) == {2, 3, 4}
+
+
+def test_exploration_moves():
+    """Test exploration moves of :class:`nalone.moves.MoveGenerator`."""
+    generator = MoveGenerator([[1, 2, 3, 4, 5], [1, 2, 3, 4, 5, 6]])
+    moves = generator.exploration_moves(0)
+
+    generator.play_card(0, 3)
+    assert generator.exploration_moves(0) is moves
+    assert set(moves) == {1, 2, 4, 5}
+    assert set(generator.exploration_moves(1)) == {1, 2, 3, 4, 5, 6}
+    with pytest.raises(ValueError):
+        generator.play_card(0, 3)
+
+    generator.take_back_cards(0, [3, 7])
+    assert set(moves) == {1, 2, 3, 4, 5, 7}
+    with pytest.raises(ValueError):
+        generator.take_back_cards(0, [11])
+
+
+def test_hunting_moves():
+    """Test hunting moves of :class:`nalone.moves.MoveGenerator`."""
+    generator = MoveGenerator([[1, 2, 3, 4, 5]])
+    moves = generator.hunting_moves()
+    creature = {Placement(HuntToken.CREATURE, i) for i in range(1, 11)}
+    artemia = {Placement(HuntToken.ARTEMIA, i) for i in range(1, 11)}
+    assert set(moves) == creature
+    with pytest.raises(ValueError):
+        generator.place_token(HuntToken.ARTEMIA)
+
+    track = Board(2, BoardType.STACKED).rescue_track
+    artemia_position = Track.move(track.head, 7)
+    generator.move_rescue_counter(artemia_position)
+    assert set(moves) == creature | artemia
+
+    generator.place_token(HuntToken.CREATURE)
+    assert set(moves) == artemia
+    with pytest.raises(ValueError):
+        generator.place_token(HuntToken.CREATURE)
+
+    generator.move_rescue_counter(track.head)
+    assert len(moves) == 0
+
+    generator.new_turn()
+    assert generator.hunting_moves() is moves
+    assert set(moves) == creature
@@ -0,0 +1,94 @@
+"""Unit tests for :mod:`nalone.replay`."""
+import pytest
+
+from nalone.board import Board
+from nalone.map import ArtemiaMap
+from nalone.replay import (Action, ActionKind, benchmark, dump_actions,
+                           load_actions, main, random_actions, replay)
+
+
+def test_random_actions():
+    """Test :func:`nalone.replay.random_actions`."""
+    actions = random_actions(200, seed=3)
+
+    assert len(actions) == 200
+    assert actions == random_actions(200, seed=3)
+    for action in actions:
+        if action.kind == ActionKind.NEIGHBORS:
+            assert 1 <= action.argument <= 10
+        else:
+            assert -2 <= action.argument <= 2
+
+
+def test_replay():
+    """Test :func:`nalone.replay.replay`."""
+    map_ = ArtemiaMap.from_permutations([range(1, 11)])[0]
+    moves = [
+        Action(ActionKind.RESCUE, 2),
+        Action(ActionKind.ASSIMILATION, 1),
+        Action(ActionKind.NEIGHBORS, 4),
+    ]
+    equivalent_moves = [
+        Action(ActionKind.RESCUE, 1),
+        Action(ActionKind.ASSIMILATION, -1),
+        Action(ActionKind.RESCUE, 1),
+        Action(ActionKind.ASSIMILATION, 1),
+        Action(ActionKind.NEIGHBORS, 4),
+    ]
+
+    digest = replay(Board(4), map_, moves)
+    assert digest == replay(Board(4), map_, equivalent_moves)
+    assert digest != replay(Board(4), map_, moves[:2])
+    assert digest != replay(Board(5), map_, moves)
+
+
+def test_benchmark():
+    """Test :func:`nalone.replay.benchmark`."""
+    actions = random_actions(50, seed=0)
+    report = benchmark(actions, number_of_players=3, runs=2)
+
+    assert report.turns == 50
+    assert report.states_per_second > 0
+    assert 0 < report.peak_bytes_per_turn <= report.max_peak_bytes
+    assert sum(report.latency_histogram.values()) == 50
+    assert len(report.digests) == 4
+    assert report.deterministic
+
+    with pytest.raises(ValueError):
+        _ = benchmark(actions, runs=0)
+
+
+def test_dump_and_load_actions(tmp_path):
+    """Test :func:`nalone.replay.dump_actions` and its loader."""
+    path = str(tmp_path / 'actions.txt')
+    actions = random_actions(100, seed=1)
+    dump_actions(actions, path)
+    loaded = load_actions(path)
+    map_ = ArtemiaMap.from_permutations([range(1, 11)])[0]
+
+    assert loaded == actions
+    assert replay(Board(4), map_, loaded) == replay(Board(4), map_, actions)
+
+
+@pytest.mark.parametrize(
+    'line', ['JUMP 2', 'RESCUE', 'RESCUE two', 'NEIGHBORS 1 2']
+)
+def test_load_actions_wrong_input(tmp_path, line):
+    """Test wrong input for :func:`nalone.replay.load_actions`."""
+    path = tmp_path / 'actions.txt'
+    path.write_text(f'RESCUE 1\n\n{line}\n')
+    with pytest.raises(ValueError, match='line 3'):
+        _ = load_actions(str(path))
+
+
+def test_main(tmp_path, capsys):
+    """Test :func:`nalone.replay.main`."""
+    path = str(tmp_path / 'actions.txt')
+    assert main(['--turns', '20', '--runs', '1', '--dump-actions', path]) == 0
+    recorded = capsys.readouterr().out
+    assert 'states per second' in recorded
+    assert len(load_actions(path)) == 20
+
+    assert main(['--actions', path, '--runs', '1']) == 0
+    replayed = capsys.readouterr().out
+    assert replayed.splitlines()[-1] == recorded.splitlines()[-1]